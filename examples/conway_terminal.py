@@ -3,7 +3,7 @@
 conway_terminal.py
 
 A Conway's Game of Life terminal runner using proper ECS architecture.
-Each cell is an entity with Cell and Position components.
+The whole grid is a single entity with a bit-packed GridState component.
 
 Controls:
  - Enter: step one generation
@@ -25,7 +25,7 @@ import termios
 import tty
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from hive import Runtime
 from hive.core import System, World
 
@@ -40,18 +40,14 @@ TICK = 0.2  # seconds between frames when running continuously
 
 
 # ECS Components
-@dataclass
-class Position:
-    row: int
-    col: int
+@dataclass(slots=True)
+class GridState:
+    """Component: bit-packed cell rows (bit c of rows[r] = cell at r, c)."""
 
+    rows: List[int]
 
-@dataclass
-class Cell:
-    alive: bool
 
-
-@dataclass
+@dataclass(slots=True)
 class GridConfig:
     """Resource: Grid dimensions and parameters"""
 
@@ -59,142 +55,221 @@ class GridConfig:
     cols: int
 
 
+@dataclass(slots=True)
+class DirtyFlag:
+    """Resource: set when the grid changed since the last render."""
+
+    dirty: bool = True
+
+
 def clear_terminal():
     sys.stdout.write("\x1b[2J\x1b[H")
     sys.stdout.flush()
 
 
-def make_grid_entities(world: World, rows: int, cols: int, randomize: bool = True):
-    """Create entities for each cell in the grid."""
-    for r in range(rows):
-        for c in range(cols):
-            entity = world.create_entity()
-            alive = random.random() < 0.25 if randomize else False
-            world.add_component(entity, Position(r, c))
-            world.add_component(entity, Cell(alive))
+def _random_row(cols: int, density: float = 0.25) -> int:
+    """Build a random row bitmask where each cell is alive with `density`.
+
+    Draws one getrandbits(cols) word per bit of probability precision
+    instead of one random() call per cell: Horner-evaluating the binary
+    fraction of `density` (OR for a 1 digit, AND for a 0 digit) leaves
+    every bit set with exactly the requested probability.
+    """
+    frac = round(density * (1 << 16))
+    if frac <= 0:
+        return 0
+    if frac >= 1 << 16:
+        return (1 << cols) - 1
+    word = 0
+    for _ in range(16):
+        draw = random.getrandbits(cols)
+        if frac & 1:
+            word |= draw
+        else:
+            word &= draw
+        frac >>= 1
+    return word
+
+
+def make_grid(world: World, rows: int, cols: int, randomize: bool = True) -> int:
+    """Create the single grid entity holding the bit-packed cell state."""
+    entity = world.create_entity()
+    row_bits = [_random_row(cols) if randomize else 0 for _ in range(rows)]
+    world.add_component(entity, GridState(row_bits))
+    return entity
+
+
+def _mark_dirty(world: World) -> None:
+    """Flag the grid as changed so the next render is not skipped."""
+    flag = world.resources.get(DirtyFlag)
+    if flag is not None:
+        flag.dirty = True
+
 
+def randomize_grid(world: World, rows: int, cols: int) -> None:
+    """Re-randomize the grid state in place."""
+    for _, state in world.store.query_cached(GridState):
+        for r in range(rows):
+            state.rows[r] = _random_row(cols)
+    _mark_dirty(world)
 
-def get_grid_from_entities(world: World, rows: int, cols: int) -> List[List[int]]:
-    """Convert entities back to grid for rendering."""
+
+def get_grid(world: World, rows: int, cols: int) -> List[List[int]]:
+    """Unpack the grid state into nested lists for rendering/inspection."""
     grid = [[0 for _ in range(cols)] for _ in range(rows)]
-    for entity, pos, cell in world.store.query(Position, Cell):
-        if 0 <= pos.row < rows and 0 <= pos.col < cols:
-            grid[pos.row][pos.col] = 1 if cell.alive else 0
+    for _, state in world.store.query_cached(GridState):
+        for r in range(rows):
+            word = state.rows[r]
+            row = grid[r]
+            for c in range(cols):
+                row[c] = (word >> c) & 1
     return grid
 
 
-def count_neighbors(world: World, row: int, col: int, rows: int, cols: int) -> int:
-    """Count alive neighbors for a cell using ECS query."""
-    count = 0
-    for dr in (-1, 0, 1):
-        for dc in (-1, 0, 1):
-            if dr == 0 and dc == 0:
-                continue
-            nr = (row + dr) % rows
-            nc = (col + dc) % cols
-            # Find entity at this position
-            for entity, pos, cell in world.store.query(Position, Cell):
-                if pos.row == nr and pos.col == nc and cell.alive:
-                    count += 1
-                    break
-    return count
+def _rotl(word: int, cols: int, mask: int) -> int:
+    """Rotate a row bitmask one cell left with toroidal wrap."""
+    return ((word << 1) | (word >> (cols - 1))) & mask
+
+
+def _rotr(word: int, cols: int, mask: int) -> int:
+    """Rotate a row bitmask one cell right with toroidal wrap."""
+    return ((word >> 1) | ((word & 1) << (cols - 1))) & mask
+
+
+def step_life(grid: List[int], out: List[int], rows: int, cols: int) -> None:
+    """Compute the next Life generation from `grid` into preallocated `out`.
+
+    Each row is a single int bitmask (bit c = cell at column c), so every
+    bitwise operation evaluates all `cols` cells at once. The 8 neighbor
+    masks per row are summed through a carry-save adder into three bit
+    planes (s0=1s, s1=2s, s2=4s); the Life rule then reduces to the
+    standard full-adder identity `next = ~s2 & s1 & (s0 | cur)` — birth on
+    exactly 3 neighbors, survival on 2 (counts >= 4 set s2, and 8 wraps to
+    0, both of which correctly kill the cell).
+    """
+    mask = (1 << cols) - 1
+    for r in range(rows):
+        # r-1 and r+1-rows are in [-rows, rows): negative indexing gives
+        # the toroidal wrap without a modulo per row
+        up = grid[r - 1]
+        cur = grid[r]
+        down = grid[r + 1 - rows]
+        words = (
+            _rotl(up, cols, mask), up, _rotr(up, cols, mask),
+            _rotl(cur, cols, mask), _rotr(cur, cols, mask),
+            _rotl(down, cols, mask), down, _rotr(down, cols, mask),
+        )
+        s0 = s1 = s2 = 0
+        for w in words:
+            c0 = s0 & w
+            s0 ^= w
+            c1 = s1 & c0
+            s1 ^= c0
+            s2 |= c1
+        out[r] = ~s2 & s1 & (s0 | cur) & mask
 
 
 class LifeSystem(System):
-    """System that calculates next generation using efficient neighbor counting."""
+    """System that steps the bit-packed grid with the bit-parallel kernel.
+
+    The grid lives in a single GridState component, so one query fetches
+    all simulation state and the step is a buffer swap — no per-cell
+    entities, components, or writeback diffing.
+
+    The kernel is injectable: any callable with step_life's signature
+    (grid, out, rows, cols) can be passed in — a Cython/C-compiled
+    stencil, or for very large grids a GPU-backed one that keeps its own
+    device buffers and only materializes the row masks on readback —
+    without touching the system or the rest of the example.
+    """
+
+    def __init__(self, kernel=step_life):
+        self._out: List[int] | None = None
+        self._config: GridConfig | None = None
+        self._kernel = kernel
 
     def update(self, world: World, dispatcher):
-        config = world.resources.get(GridConfig)
-        rows, cols = config.rows, config.cols
-
-        # Build a lookup table: (row, col) -> (entity, cell)
-        # This is O(n) instead of O(n²) for neighbor queries
-        grid_map = {}
-        for entity, pos, cell in world.store.query(Position, Cell):
-            grid_map[(pos.row, pos.col)] = (entity, cell)
-
-        # Calculate next state for all cells
-        updates = []  # (entity, new_alive_state)
-
-        for (row, col), (entity, cell) in grid_map.items():
-            # Count neighbors using the lookup table
-            neighbors = 0
-            for dr in (-1, 0, 1):
-                for dc in (-1, 0, 1):
-                    if dr == 0 and dc == 0:
-                        continue
-                    nr = (row + dr) % rows
-                    nc = (col + dc) % cols
-                    neighbor_key = (nr, nc)
-                    if neighbor_key in grid_map:
-                        _, neighbor_cell = grid_map[neighbor_key]
-                        if neighbor_cell.alive:
-                            neighbors += 1
-
-            if cell.alive:
-                # Alive: stays alive with 2 or 3 neighbors
-                new_state = neighbors in (2, 3)
-            else:
-                # Dead: becomes alive with exactly 3 neighbors
-                new_state = neighbors == 3
+        if self._config is None:
+            self._config = world.resources.get(GridConfig)
+        rows, cols = self._config.rows, self._config.cols
 
-            if new_state != cell.alive:
-                updates.append((entity, new_state))
+        flag = world.resources.get(DirtyFlag)
+        for _, state in world.store.query_cached(GridState):
+            if self._out is None or len(self._out) != rows:
+                self._out = [0] * rows
+            self._kernel(state.rows, self._out, rows, cols)
+            if self._out != state.rows:
+                state.rows, self._out = self._out, state.rows
+                if flag is not None:
+                    flag.dirty = True
 
-        # Apply updates
-        for entity, new_alive in updates:
-            # Find and update the cell component
-            for (row, col), (e, cell) in grid_map.items():
-                if e == entity:
-                    cell.alive = new_alive
-                    break
+
+_CELL_CHARS = str.maketrans("01", DEAD + ALIVE)
+
+
+def render_rows(row_bits: List[int], cols: int) -> List[str]:
+    """Format bit-packed rows as terminal lines without per-cell loops.
+
+    format() emits each row word as a binary string, [::-1] restores
+    column order (bit c is column c), and translate() maps bits to
+    glyphs — all C-level string operations.
+    """
+    spec = f"0{cols}b"
+    return [format(word, spec)[::-1].translate(_CELL_CHARS) for word in row_bits]
 
 
 class RenderSystem(System):
     """System that renders the grid to terminal."""
 
+    def __init__(self):
+        self._config: GridConfig | None = None
+
     def update(self, world: World, dispatcher):
-        config = world.resources.get(GridConfig)
-        rows, cols = config.rows, config.cols
+        # GridConfig is static for the lifetime of the run; fetch it once
+        if self._config is None:
+            self._config = world.resources.get(GridConfig)
+        cols = self._config.cols
 
-        grid = get_grid_from_entities(world, rows, cols)
+        # Skip the whole string rebuild while the grid is unchanged
+        flag = world.resources.get(DirtyFlag)
+        if flag is not None and not flag.dirty:
+            return
 
         out_lines = []
-        for row in grid:
-            out_lines.append("".join(ALIVE if c else DEAD for c in row))
+        for _, state in world.store.query_cached(GridState):
+            out_lines.extend(render_rows(state.rows, cols))
 
         buf = "\n".join(out_lines)
         world.resources.register(RenderBuffer(buf))
+        if flag is not None:
+            flag.dirty = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderBuffer:
     """Resource: Rendered output buffer"""
 
     content: str
 
 
-def center_pattern(world: World, pattern: List[Tuple[int, int]], rows: int, cols: int):
-    """Place a pattern at the center of the grid."""
+def center_pattern(world: World, pattern: Sequence[Tuple[int, int]], rows: int, cols: int):
+    """Place a pattern at the center of an otherwise cleared grid.
+
+    O(rows + |pattern|): clears the row masks and sets one bit per
+    pattern coordinate, with no per-cell or per-entity scanning.
+    """
     r0 = rows // 2
     c0 = cols // 2
 
-    # Clear all cells first
-    for entity, pos, cell in world.store.query(Position, Cell):
-        cell.alive = False
-
-    # Set pattern cells
-    for dr, dc in pattern:
-        rr = (r0 + dr) % rows
-        cc = (c0 + dc) % cols
-        for entity, pos, cell in world.store.query(Position, Cell):
-            if pos.row == rr and pos.col == cc:
-                cell.alive = True
-                break
+    for _, state in world.store.query_cached(GridState):
+        state.rows[:] = [0] * rows
+        for dr, dc in pattern:
+            state.rows[(r0 + dr) % rows] |= 1 << ((c0 + dc) % cols)
+    _mark_dirty(world)
 
 
-GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
-PULSAR = [
+GLIDER = ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2))
+PULSAR = (
     (-4, -2),
     (-4, -1),
     (-4, 0),
@@ -215,7 +290,7 @@ PULSAR = [
     (0, 4),
     (1, 4),
     (2, 4),
-]
+)
 
 
 def get_char_nonblocking():
@@ -231,22 +306,23 @@ def render_current_state(runtime, world: World):
     runtime.step()
     try:
         buf = runtime.world.resources.get(RenderBuffer)
-        clear_terminal()
-        sys.stdout.write(buf.content + "\n")
-        sys.stdout.flush()
     except KeyError:
-        pass
+        return
+    # Clear, home and frame in a single write()/flush() pair
+    sys.stdout.write("\x1b[2J\x1b[H" + buf.content + "\n")
+    sys.stdout.flush()
 
 
 def run_terminal(rows=ROWS, cols=COLS):
     runtime = Runtime()
     world = runtime.world
 
-    # Register grid config as resource
+    # Register grid config and render dirty flag as resources
     runtime.world.resources.register(GridConfig(rows, cols))
+    runtime.world.resources.register(DirtyFlag())
 
-    # Create entities for all cells
-    make_grid_entities(world, rows, cols, randomize=True)
+    # Create the grid entity
+    make_grid(world, rows, cols, randomize=True)
 
     # Register systems
     world.register(LifeSystem(), priority=0)
@@ -254,9 +330,9 @@ def run_terminal(rows=ROWS, cols=COLS):
 
     # Initial render
     clear_terminal()
-    grid = get_grid_from_entities(world, rows, cols)
-    for row in grid:
-        print("".join(ALIVE if c else DEAD for c in row))
+    for _, state in world.store.query_cached(GridState):
+        for line in render_rows(state.rows, cols):
+            print(line)
 
     print(
         "\nControls: Enter=step, r=run, s=stop, c=randomize, g=glider, p=pulsar, q=quit"
@@ -286,6 +362,17 @@ def run_terminal(rows=ROWS, cols=COLS):
             sys.stdout.flush()
 
 
+# Keys that edit the grid, then share a single render-and-pause path.
+# Enter maps to no edit (step + render only); remapping is data-driven.
+_EDIT_ACTIONS = {
+    "\n": None,
+    "\r": None,
+    "c": lambda world, rows, cols: randomize_grid(world, rows, cols),
+    "g": lambda world, rows, cols: center_pattern(world, GLIDER, rows, cols),
+    "p": lambda world, rows, cols: center_pattern(world, PULSAR, rows, cols),
+}
+
+
 def _run_interactive_loop(runtime, world: World, rows, cols):
     """Main interactive loop with non-blocking input."""
     running = False
@@ -296,38 +383,23 @@ def _run_interactive_loop(runtime, world: World, rows, cols):
         char = get_char_nonblocking()
 
         if char:
-            if char == "\n" or char == "\r":  # Enter key
-                render_current_state(runtime, world)
-                running = False
+            if char == "q":
+                break
 
-            elif char == "r":
+            if char == "r":
                 running = True
                 last_step = time.time()
 
             elif char == "s":
                 running = False
 
-            elif char == "c":
-                # Destroy all entities and recreate
-                for entity in list(world.store.query_entities(Position, Cell)):
-                    world.destroy_entity(entity)
-                make_grid_entities(world, rows, cols, randomize=True)
-                render_current_state(runtime, world)
-                running = False
-
-            elif char == "g":
-                center_pattern(world, GLIDER, rows, cols)
+            elif char in _EDIT_ACTIONS:
+                action = _EDIT_ACTIONS[char]
+                if action is not None:
+                    action(world, rows, cols)
                 render_current_state(runtime, world)
                 running = False
 
-            elif char == "p":
-                center_pattern(world, PULSAR, rows, cols)
-                render_current_state(runtime, world)
-                running = False
-
-            elif char == "q":
-                break
-
         # Auto-step if running
         if running:
             now = time.time()
@@ -335,7 +407,8 @@ def _run_interactive_loop(runtime, world: World, rows, cols):
                 render_current_state(runtime, world)
                 last_step = now
             else:
-                time.sleep(now - last_step)
+                # Sleep until the next tick deadline instead of spinning
+                time.sleep(max(0.0, last_step + TICK - now))
         else:
             # Small sleep to prevent CPU spinning when idle
             time.sleep(0.01)
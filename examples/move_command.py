@@ -13,18 +13,18 @@ from hive import Runtime
 from hive.core import System, World
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: int
     y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Renderable:
     symbol: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Move:
     entity: int
     dx: int
@@ -37,11 +37,13 @@ class Movement(System):
     def __init__(self, pattern=None):
         self.tick = 0
         self.pattern = pattern or [(1, 0), (0, 1), (-1, 0), (0, -1)]
+        self._positions = None
 
     def update(self, world: World, dispatcher):
-        for entity in world.store.query_entities(Position):
-            dx, dy = self.pattern[self.tick % len(self.pattern)]
-            dispatcher.dispatch(Move(entity, dx, dy))
+        dx, dy = self.pattern[self.tick % len(self.pattern)]
+        dispatcher.extend(
+            Move(entity, dx, dy) for entity in world.store.query_entities(Position)
+        )
         self.tick += 1
 
     def handle_move(self, cmd: Move, world: World) -> None:
@@ -50,21 +52,25 @@ class Movement(System):
         Receives the command and the world instance.
         Access components through the world's component storage.
         """
-        comps = world.store.get_components(Position)
-        if cmd.entity in comps:
-            pos = comps[cmd.entity]
+        # The view is live, so fetch it once and reuse it per command
+        if self._positions is None:
+            self._positions = world.store.get_components_view(Position)
+        pos = self._positions.get(cmd.entity)
+        if pos is not None:
             pos.x += cmd.dx
             pos.y += cmd.dy
 
 
 class Renderer(System):
     def update(self, world: World, dispatcher):
-        positions = world.store.get_components(Position)
-        renderables = world.store.get_components(Renderable)
+        positions = world.store.get_components_view(Position)
+        renderables = world.store.get_components_view(Renderable)
+        # Entities are created in id order and never destroyed in this demo,
+        # so dict insertion order is already sorted - no per-tick sorted().
+        get_renderable = renderables.get
         out = []
-        for eid in sorted(positions.keys()):
-            pos = positions[eid]
-            sym = renderables.get(eid)
+        for eid, pos in positions.items():
+            sym = get_renderable(eid)
             ch = sym.symbol if sym else "?"
             out.append(f"{ch}{eid}@({pos.x},{pos.y})")
         print(" | ".join(out))
@@ -11,13 +11,13 @@ from hive import Runtime
 from hive.core import System, World
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: int
     y: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Renderable:
     symbol: str
 
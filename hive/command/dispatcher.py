@@ -16,9 +16,17 @@ class CommandDispatcher:
     def dispatch(self, command) -> None:
         self.queue.append(command)
 
+    def extend(self, commands) -> None:
+        """Queue an iterable of commands in one C-level append."""
+        self.queue.extend(commands)
+
     def pop_all(self):
-        items = list(self.queue)
-        self.queue.clear()
+        """Detach and return all queued commands as an iterable.
+
+        O(1): swaps in a fresh deque instead of copying and clearing.
+        """
+        items = self.queue
+        self.queue = deque()
         return items
 
     def pop(self):
@@ -30,6 +38,7 @@ class CommandDispatcher:
 
         The handler is provided by the host and may dispatch new commands.
         """
-        while self.queue:
-            cmd = self.queue.popleft()
-            handler(cmd)
+        queue = self.queue
+        popleft = queue.popleft
+        while queue:
+            handler(popleft())
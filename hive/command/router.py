@@ -65,10 +65,14 @@ class CommandRouter:
         Returns:
             Stats dict mapping {cmd_type: count} for routed commands
         """
+        # Bind the lookup once; one dict probe per command, no route() call
+        get = self._handlers.get
         stats = {}
         for cmd in commands:
             cmd_type = type(cmd)
-            if self.route(cmd, world):
+            handler = get(cmd_type)
+            if handler is not None:
+                handler(cmd, world)
                 stats[cmd_type] = stats.get(cmd_type, 0) + 1
         return stats
 
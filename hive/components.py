@@ -8,8 +8,13 @@ AI, etc.) belong in host applications or example projects.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Destroyed:
     """Marker component indicating an entity should be removed."""
 
     pass
+
+
+# Shared instance: the marker is frozen and stateless, so every entity can
+# reference this one object instead of allocating a fresh Destroyed()
+DESTROYED = Destroyed()
@@ -37,6 +37,7 @@ class World:
     def __init__(self):
         self._store = Store()
         self._systems: List[Tuple[int, object]] = []
+        self._update_fns: Tuple = ()
         self.event_bus = EventBus()
         self.resources = ResourceRegistry()
 
@@ -54,6 +55,10 @@ class World:
         """Destroy an entity and all its components."""
         self._store.destroy_entity(entity)
 
+    def destroy_entities(self, entities) -> None:
+        """Destroy many entities in a single batched pass."""
+        self._store.destroy_entities(entities)
+
     def add_component(self, entity: int, component) -> None:
         """Add a component to an entity."""
         self._store.add_component(entity, component)
@@ -62,6 +67,10 @@ class World:
         """Get all components of a specific type."""
         return self._store.get_components(component_type)
 
+    def get_components_view(self, component_type: Type):
+        """Get a shared read-only view of all components of a type."""
+        return self._store.get_components_view(component_type)
+
     def has_component(self, entity: int, component_type: Type) -> bool:
         """Check if an entity has a specific component."""
         return self._store.has_component(entity, component_type)
@@ -81,6 +90,18 @@ class World:
         """
         return self._store.query(*component_types)
 
+    def query_cached(self, *component_types: Type) -> list:
+        """Query entities with all component types, cached across calls.
+
+        Returns a shared list that is rebuilt only when components have
+        been added or removed since the last call.
+        """
+        return self._store.query_cached(*component_types)
+
+    def query_entities_list(self, *component_types: Type) -> list:
+        """Query entity IDs as a cached list (supports len and reuse)."""
+        return self._store.query_entities_list(*component_types)
+
     def query_single(self, eid: int, component_type: Type) -> Any | None:
         """Query a component with matching entity id."""
 
@@ -88,17 +109,28 @@ class World:
 
     # System management
     def register(self, system, priority: int = 0) -> None:
-        """Register a system with optional priority (lower = earlier)."""
+        """Register a system with optional priority (lower = earlier).
+
+        Raises:
+            TypeError: If the system has no callable `update` method
+        """
+        if not callable(getattr(system, "update", None)):
+            raise TypeError(
+                f"System {type(system).__name__} has no callable update() method"
+            )
         self._systems.append((priority, system))
         self._systems.sort(key=lambda t: t[0])
+        # Rebuild the bound-method tuple once per registration, not per step
+        self._update_fns = tuple(s.update for _, s in self._systems)
 
     def step(self, dispatcher=None) -> None:
         """Execute one simulation step.
 
         Runs all systems in priority order, passing world and dispatcher.
         """
-        for _, system in list(self._systems):
-            system.update(self, dispatcher)
+        # Tuple snapshot: a system registered mid-step is picked up next step
+        for update in self._update_fns:
+            update(self, dispatcher)
 
     def snapshot(self):
         """Create a serializable snapshot of the world state."""
@@ -9,27 +9,53 @@ class EventBus:
 
     def __init__(self):
         self._subs = defaultdict(list)
+        self._token_types = {}
         self._next_id = 0
+        self._emitting = 0
+
+    def _mutable_handlers(self, event_type):
+        """Return a handler list safe to mutate.
+
+        If an emit is currently iterating, swap in a copy so the
+        in-flight iteration keeps seeing the snapshot it started with.
+        """
+        handlers = self._subs[event_type]
+        if self._emitting:
+            handlers = list(handlers)
+            self._subs[event_type] = handlers
+        return handlers
 
     def on(self, event_type, handler):
-        token = (event_type, self._next_id)
+        token = self._next_id
         self._next_id += 1
-        self._subs[event_type].append((token, handler))
+        self._token_types[token] = event_type
+        self._mutable_handlers(event_type).append((token, handler))
         return token
 
     def off(self, token):
-        event_type, tid = token
-        handlers = self._subs.get(event_type, [])
-        for i, (t, h) in enumerate(handlers):
-            if t == token:
+        event_type = self._token_types.pop(token, None)
+        if event_type is None:
+            return False
+        handlers = self._mutable_handlers(event_type)
+        for i, (tid, _handler) in enumerate(handlers):
+            if tid == token:
                 handlers.pop(i)
                 return True
         return False
 
     def emit(self, event, world=None, dispatcher=None):
         event_type = type(event)
-        for _, handler in list(self._subs.get(event_type, [])):
-            try:
-                handler(event, world, dispatcher)
-            except Exception:
-                logger.exception(f"Event handler failed for {event_type.__name__}")
+        handlers = self._subs.get(event_type)
+        if not handlers:
+            return
+        # Iterate the live list; on/off copy-on-write while an emit is in
+        # flight, so no per-emit snapshot allocation is needed here.
+        self._emitting += 1
+        try:
+            for _, handler in handlers:
+                try:
+                    handler(event, world, dispatcher)
+                except Exception:
+                    logger.exception(f"Event handler failed for {event_type.__name__}")
+        finally:
+            self._emitting -= 1
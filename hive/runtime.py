@@ -62,10 +62,9 @@ class Runtime:
         processed. Commands emitted by handlers during this call remain in the
         dispatcher's queue and will be processed later.
         """
-        commands = self._dispatcher.pop_all()
-        if not commands:
+        if not self._dispatcher.queue:
             return 0
-        return self._handle_commands(commands)
+        return self._handle_commands(self._dispatcher.pop_all())
 
     def step(self) -> None:
         """Execute one simulation step.
@@ -74,9 +73,8 @@ class Runtime:
         the global `steps` counter.
         """
         self._world.step(self._dispatcher)
-        commands = self._dispatcher.pop_all()
-        if commands:
-            self._handle_commands(commands)
+        if self._dispatcher.queue:
+            self._handle_commands(self._dispatcher.pop_all())
         self.steps += 1
 
     def step_until_idle(self) -> int:
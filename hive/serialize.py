@@ -1,41 +1,111 @@
 import dataclasses
 import json
+import sys
+import typing
 from typing import Any
 
+try:
+    # Optional accelerator: orjson serializes dict-heavy snapshots several
+    # times faster than stdlib json. hive itself stays dependency-free.
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 _serializers = {}
 
+# Name -> class map used to resolve snapshot type names without
+# scanning sys.modules on every deserialized component
+_type_registry: dict[str, type] = {}
+
+# Per-class to_dict/from_dict resolution, computed once on first encounter
+_type_serializers = {}
+_type_deserializers = {}
+
+# Per-class snapshot name, resolved once (keys snapshot sections and the
+# __type__ tag on every serialized component)
+_name_of: dict[type, str] = {}
+
+
+def _tname(cls: type) -> str:
+    name = _name_of.get(cls)
+    if name is None:
+        name = cls.__name__
+        _name_of[cls] = name
+    return name
+
+
+# Field types that the generated shallow to_dict may emit as-is
+_SCALARS = (int, float, str, bool, bytes, type(None))
+
+
+def _is_flat(cls: type) -> bool:
+    """True when every field of `cls` is a plain scalar type.
+
+    Only flat dataclasses get the generated shallow to_dict; nested
+    dataclasses and containers need dataclasses.asdict's recursive
+    conversion to stay JSON-serializable. Unresolvable annotations
+    count as non-flat (asdict is always correct, just slower).
+    """
+    try:
+        hints = typing.get_type_hints(cls)
+    except Exception:
+        return False
+    return all(hints.get(f.name) in _SCALARS for f in dataclasses.fields(cls))
+
+
+def _gen_to_dict(cls: type):
+    """exec-compile a shallow to_dict for a flat dataclass.
+
+    Produces straight-line attribute loads into a dict literal instead
+    of dataclasses.asdict's recursive deep copy. Only used for classes
+    that pass _is_flat.
+    """
+    items = ", ".join(f"{f.name!r}: o.{f.name}" for f in dataclasses.fields(cls))
+    ns = {}
+    exec(f"def to_dict(o):\n    return {{{items}}}", ns)
+    return ns["to_dict"]
+
+
+def _gen_from_dict(cls: type):
+    """exec-compile the matching constructor call for a dataclass.
+
+    Arguments are passed by keyword, matching the baseline cls(**data)
+    behavior, so kw_only dataclasses construct correctly.
+    """
+    args = ", ".join(f"{f.name}=d[{f.name!r}]" for f in dataclasses.fields(cls))
+    ns = {"_cls": cls}
+    exec(f"def from_dict(d):\n    return _cls({args})", ns)
+    return ns["from_dict"]
+
 
 def register_serializer(type_, to_dict, from_dict):
     _serializers[type_.__name__] = (type_, to_dict, from_dict)
+    _type_registry[type_.__name__] = type_
+    # A late registration overrides any previously resolved fallback
+    _type_serializers.pop(type_, None)
 
 
-def _serialize_component(obj: Any) -> dict[str, Any]:
-    tname = type(obj).__name__
-    if dataclasses.is_dataclass(obj):
-        return {"__type__": tname, "data": dataclasses.asdict(obj)}
-    if tname in _serializers:
-        to_dict = _serializers[tname][1]
-        return {"__type__": tname, "data": to_dict(obj)}
-    # fallback to __dict__ if possible
-    if hasattr(obj, "__dict__"):
-        return {"__type__": tname, "data": dict(obj.__dict__)}
-    raise TypeError(f"No serializer for component type {tname}")
+def register_component_type(cls: type) -> type:
+    """Register a class for snapshot loading by name.
 
+    Avoids the sys.modules fallback scan when deserializing; usable as a
+    decorator on component dataclasses.
+    """
+    _type_registry[cls.__name__] = cls
+    return cls
 
-def _deserialize_component(obj: Any) -> dict[str, Any]:
-    tname = obj["__type__"]
-    data = obj["data"]
-    if tname in _serializers:
-        from_dict = _serializers[tname][2]
-        return from_dict(data)
-    # Best-effort: if no custom serializer, assume dataclass and try to
-    # reconstruct by finding a class with matching name in the global scope.
-    # Try to find the class in module globals first, then in builtins
+
+def _resolve_type(tname: str) -> type | None:
+    """Find the class for a snapshot type name, caching the result.
+
+    Checks the registry first; on a miss, falls back to scanning loaded
+    modules once and remembers what it finds.
+    """
+    cls = _type_registry.get(tname)
+    if cls is not None:
+        return cls
     cls = globals().get(tname)
     if cls is None:
-        # try to locate class in loaded modules
-        import sys
-
         for mod in list(sys.modules.values()):
             if not mod:
                 continue
@@ -43,8 +113,58 @@ def _deserialize_component(obj: Any) -> dict[str, Any]:
             if c is not None:
                 cls = c
                 break
+    if cls is not None:
+        _type_registry[tname] = cls
+    return cls
+
+
+def _dict_fallback(obj: Any) -> dict[str, Any]:
+    if hasattr(obj, "__dict__"):
+        return dict(obj.__dict__)
+    raise TypeError(f"No serializer for component type {type(obj).__name__}")
+
+
+def _serializer_for(cls: type):
+    """Resolve (once per class) how instances become plain dicts.
+
+    A registered to_dict always wins, so register_serializer can
+    override the dataclass handling; flat dataclasses then get the
+    generated shallow to_dict, nested ones fall back to asdict, and
+    everything else gets a __dict__ copy.
+    """
+    ser = _type_serializers.get(cls)
+    if ser is None:
+        entry = _serializers.get(cls.__name__)
+        if entry is not None:
+            ser = entry[1]
+        elif dataclasses.is_dataclass(cls):
+            ser = _gen_to_dict(cls) if _is_flat(cls) else dataclasses.asdict
+        else:
+            ser = _dict_fallback
+        _type_serializers[cls] = ser
+    return ser
+
+
+def _serialize_component(obj: Any) -> dict[str, Any]:
+    cls = type(obj)
+    return {"__type__": _tname(cls), "data": _serializer_for(cls)(obj)}
+
+
+def _deserialize_component(obj: Any) -> dict[str, Any]:
+    tname = obj["__type__"]
+    data = obj["data"]
+    entry = _serializers.get(tname)
+    if entry is not None:
+        return entry[2](data)
+    # Best-effort: if no custom serializer, assume dataclass and resolve
+    # the class by name (registry first, module scan once on a miss)
+    cls = _resolve_type(tname)
     if cls is not None and dataclasses.is_dataclass(cls):
-        return cls(**data)
+        from_dict = _type_deserializers.get(cls)
+        if from_dict is None:
+            from_dict = _gen_from_dict(cls)
+            _type_deserializers[cls] = from_dict
+        return from_dict(data)
     raise TypeError(f"No deserializer for component type {tname}")
 
 
@@ -54,11 +174,16 @@ def snapshot(world) -> dict[str, Any]:
         "next_id": world.store._next_id,
         "components": {},
     }
+    components = payload["components"]
     for t, cmap in world.store._components.items():
-        arr = {}
-        for eid, comp in cmap.items():
-            arr[str(eid)] = _serialize_component(comp)
-        payload["components"][t.__name__] = arr
+        # Resolve the serializer and type name once per component type,
+        # then serialize the whole map in one comprehension
+        tname = _tname(t)
+        ser = _serializer_for(t)
+        components[tname] = {
+            str(eid): {"__type__": tname, "data": ser(comp)}
+            for eid, comp in cmap.items()
+        }
     # include resources when serializable (dataclasses or registered)
     resources = {}
     for k, v in world.resources.all().items():
@@ -84,7 +209,9 @@ def load_into_world(snapshot_obj, world) -> None:
         for sid, serialized in mapping.items():
             eid = int(sid)
             comp = _deserialize_component(serialized)
-            world.store._components.setdefault(type(comp), {})[eid] = comp
+            # Through add_component so the store's structural version is
+            # bumped and cached query results are invalidated
+            world.add_component(eid, comp)
     # resources
     for k, serialized in snapshot_obj.get("resources", {}).items():
         try:
@@ -95,4 +222,53 @@ def load_into_world(snapshot_obj, world) -> None:
 
 
 def dump_to_json(snapshot_obj, fp) -> None:
+    """Write a snapshot dict to `fp` as JSON.
+
+    Uses orjson when installed (binary or text `fp`); otherwise falls
+    back to stdlib json, which requires a text-mode `fp`.
+    """
+    if _orjson is not None:
+        data = _orjson.dumps(snapshot_obj)
+        try:
+            fp.write(data)
+        except TypeError:
+            # text-mode file object
+            fp.write(data.decode())
+        return
     json.dump(snapshot_obj, fp)
+
+
+def stream_snapshot(world, fp) -> None:
+    """Write a snapshot of `world` to `fp` as JSON, component by component.
+
+    Produces the same document as `dump_to_json(snapshot(world), fp)` but
+    streams it incrementally, so peak memory stays at one serialized
+    component instead of the whole world's dict tree.
+    """
+    write = fp.write
+    dumps = json.dumps
+    write('{"next_id": %d, "components": {' % world.store._next_id)
+    first_type = True
+    for t, cmap in world.store._components.items():
+        tname = _tname(t)
+        ser = _serializer_for(t)
+        write(("" if first_type else ", ") + dumps(tname) + ": {")
+        first_type = False
+        first = True
+        for eid, comp in cmap.items():
+            write(('"%d": ' if first else ', "%d": ') % eid)
+            first = False
+            write(dumps({"__type__": tname, "data": ser(comp)}))
+        write("}")
+    write('}, "resources": {')
+    first = True
+    for k, v in world.resources.all().items():
+        try:
+            serialized = _serialize_component(v)
+        except TypeError:
+            # skip non-serializable resources, as snapshot() does
+            continue
+        write(("" if first else ", ") + dumps(str(k)) + ": ")
+        first = False
+        write(dumps(serialized))
+    write("}}")
@@ -3,7 +3,9 @@
 Store is the data layer of the ECS - owns entities, components, and queries.
 """
 
-from typing import Dict, Any, Type, Iterator, Tuple
+from array import array
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Type, Iterator, Tuple
 
 
 class Store:
@@ -23,8 +25,16 @@ class Store:
 
     def __init__(self):
         self._next_id = 0
-        self._free_ids: list[int] = []
+        # Unboxed 64-bit ids: 8 bytes per entry instead of a PyLong each
+        self._free_ids = array("q")
+        # Mirrors _free_ids for O(1) membership checks on destroy
+        self._free_ids_set: set[int] = set()
         self._components: Dict[Type, Dict[int, Any]] = {}
+        # Structural version: bumped whenever components are added/removed.
+        self._version = 0
+        self._query_cache: Dict[Tuple[Type, ...], Tuple[int, list]] = {}
+        self._id_cache: Dict[Tuple[Type, ...], Tuple[int, list]] = {}
+        self._views: Dict[Type, Mapping[int, Any]] = {}
 
     def create_entity(self) -> int:
         """Create a new entity with recycled ID if available.
@@ -37,7 +47,9 @@ class Store:
         """
         # Use recycled ID if available
         if self._free_ids:
-            return self._free_ids.pop()
+            eid = self._free_ids.pop()
+            self._free_ids_set.discard(eid)
+            return eid
 
         # Generate new ID
         eid = self._next_id
@@ -57,12 +69,41 @@ class Store:
         """
         # Remove all components for this entity
         for comp_map in self._components.values():
-            comp_map.pop(entity, None)
+            if comp_map.pop(entity, None) is not None:
+                self._version += 1
 
         # Recycle ID with safety limit to prevent memory bloat
         if len(self._free_ids) < self.MAX_FREE_IDS:
-            if entity not in self._free_ids:
+            if entity not in self._free_ids_set:
                 self._free_ids.append(entity)
+                self._free_ids_set.add(entity)
+
+    def destroy_entities(self, entities) -> None:
+        """Destroy many entities in one pass per component map.
+
+        Equivalent to calling destroy_entity() for each entity, but each
+        component map is visited once with a batched removal instead of
+        once per entity. IDs are recycled under the same safety limit.
+        """
+        batch = set(entities)
+        if not batch:
+            return
+
+        for comp_map in self._components.values():
+            removed = batch.intersection(comp_map)
+            if removed:
+                for entity in removed:
+                    del comp_map[entity]
+                self._version += 1
+
+        # Extend the free list in ascending order; create_entity pops LIFO
+        recyclable = self._free_ids_set
+        for entity in sorted(batch):
+            if len(self._free_ids) >= self.MAX_FREE_IDS:
+                break
+            if entity not in recyclable:
+                self._free_ids.append(entity)
+                recyclable.add(entity)
 
     def add_component(self, entity: int, component) -> None:
         """Add a component to an entity.
@@ -73,6 +114,7 @@ class Store:
         if comp_type not in self._components:
             self._components[comp_type] = {}
         self._components[comp_type][entity] = component
+        self._version += 1
 
     def get_components(self, component_type: Type) -> Dict[int, Any]:
         """Get all components of a specific type.
@@ -81,6 +123,23 @@ class Store:
         """
         return self._components.get(component_type, {})
 
+    def get_components_view(self, component_type: Type) -> Mapping[int, Any]:
+        """Get a shared read-only view of all components of a type.
+
+        The view tracks the live component map (no copying) but cannot
+        add or remove entries, making it safe to hand to systems that
+        only read or mutate components in place. Views are cached per
+        component type, so repeated calls allocate nothing.
+        """
+        view = self._views.get(component_type)
+        if view is None:
+            # Create the map if needed so a view fetched before the first
+            # add_component still tracks it once components arrive
+            comp_map = self._components.setdefault(component_type, {})
+            view = MappingProxyType(comp_map)
+            self._views[component_type] = view
+        return view
+
     def has_component(self, entity: int, component_type: Type) -> bool:
         """Check if an entity has a specific component."""
         return entity in self._components.get(component_type, {})
@@ -94,6 +153,7 @@ class Store:
         if component_type in self._components:
             if entity in self._components[component_type]:
                 del self._components[component_type][entity]
+                self._version += 1
                 return True
         return False
 
@@ -105,23 +165,26 @@ class Store:
         types don't exist (ECS semantics - no error).
         """
         if not component_types:
-            return iter(())
+            return
 
-        # Get sets of entities for each component type
-        sets = []
+        maps = []
         for comp_type in component_types:
-            comp_map = self._components.get(comp_type, {})
+            comp_map = self._components.get(comp_type)
             if not comp_map:  # Empty or missing component type
-                return iter(())
-            sets.append(set(comp_map.keys()))
-
-        if not sets:
-            return iter(())
-
-        # Find intersection (entities with ALL component types)
-        ids = set.intersection(*sets)
-        for eid in sorted(ids):
-            yield eid
+                return
+            maps.append(comp_map)
+
+        # Iterate the smallest map and probe the others, instead of
+        # materializing a set per type and intersecting: no per-query
+        # copies, and each candidate early-outs on its first miss
+        smallest = min(maps, key=len)
+        others = [m for m in maps if m is not smallest]
+        if not others:
+            yield from sorted(smallest)
+            return
+        for eid in sorted(smallest):
+            if all(eid in m for m in others):
+                yield eid
 
     def query(self, *component_types: Type) -> Iterator[Tuple[int, ...]]:
         """Yield tuples (entity, comp1, comp2, ...) for matching entities.
@@ -133,6 +196,40 @@ class Store:
         for eid in self.query_entities(*component_types):
             yield (eid,) + tuple(self._components[t][eid] for t in component_types)
 
+    def query_cached(self, *component_types: Type) -> list:
+        """Return query() results as a list, cached across calls.
+
+        The cached list is rebuilt lazily whenever components have been
+        added or removed since it was built, so repeated queries for a
+        stable set of entities cost a dict lookup instead of a full scan.
+        Mutating fields of the returned components does not invalidate
+        the cache (the same component objects are shared).
+
+        Callers must not mutate the returned list.
+        """
+        cached = self._query_cache.get(component_types)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        result = list(self.query(*component_types))
+        self._query_cache[component_types] = (self._version, result)
+        return result
+
+    def query_entities_list(self, *component_types: Type) -> list:
+        """Return query_entities() results as a list of ids, cached.
+
+        For callers that need len() or repeated iteration, this avoids
+        re-running the query each time: like query_cached, the list is
+        rebuilt only after a structural change.
+
+        Callers must not mutate the returned list.
+        """
+        cached = self._id_cache.get(component_types)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        result = list(self.query_entities(*component_types))
+        self._id_cache[component_types] = (self._version, result)
+        return result
+
     def query_single(self, eid: int, component_type: Type) -> Any | None:
         """Get component for matching entity."""
         return self._components.get(component_type, {}).get(eid)
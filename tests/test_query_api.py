@@ -38,6 +38,57 @@ def test_query_and_query_entities_basic():
     assert list(w.query_entities(A, B)) == []
 
 
+def test_query_cached_reuses_until_structural_change():
+    w = World()
+    e1 = w.create_entity()
+    e2 = w.create_entity()
+    w.add_component(e1, A(1))
+    w.add_component(e2, A(2))
+
+    first = w.query_cached(A)
+    assert [eid for eid, _ in first] == [e1, e2]
+    # Stable store: same list object is returned
+    assert w.query_cached(A) is first
+
+    # Structural change invalidates the cache
+    e3 = w.create_entity()
+    w.add_component(e3, A(3))
+    second = w.query_cached(A)
+    assert second is not first
+    assert [eid for eid, _ in second] == [e1, e2, e3]
+
+    w.destroy_entity(e1)
+    assert [eid for eid, _ in w.query_cached(A)] == [e2, e3]
+
+
+def test_query_entities_list_is_cached_list_of_ids():
+    w = World()
+    e1 = w.create_entity()
+    e2 = w.create_entity()
+    w.add_component(e1, A(1))
+    w.add_component(e2, A(2))
+    w.add_component(e2, B("y"))
+
+    ids = w.query_entities_list(A, B)
+    assert ids == [e2]
+    assert w.query_entities_list(A, B) is ids
+
+    w.add_component(e1, B("x"))
+    assert w.query_entities_list(A, B) == [e1, e2]
+
+
+def test_register_rejects_system_without_update():
+    import pytest
+
+    w = World()
+
+    class NotASystem:
+        pass
+
+    with pytest.raises(TypeError):
+        w.register(NotASystem())
+
+
 def test_event_bus_and_resources_minimal():
     bus = EventBus()
     called = []
@@ -52,6 +103,7 @@ def test_event_bus_and_resources_minimal():
     bus.emit(E(), None, None)
     assert called == [True]
     assert bus.off(token) is True
+    assert bus.off(token) is False
 
     @dataclass
     class Config:
@@ -60,3 +112,30 @@ def test_event_bus_and_resources_minimal():
     r = ResourceRegistry()
     r.register(Config(x=1))
     assert r.get(Config).x == 1
+
+
+def test_event_bus_unsubscribe_during_emit():
+    bus = EventBus()
+    called = []
+
+    class E:
+        pass
+
+    tokens = {}
+
+    def h1(ev, world, dispatcher):
+        called.append("h1")
+        # Unsubscribing mid-emit must not disturb the current delivery
+        bus.off(tokens["h2"])
+
+    def h2(ev, world, dispatcher):
+        called.append("h2")
+
+    bus.on(E, h1)
+    tokens["h2"] = bus.on(E, h2)
+
+    bus.emit(E(), None, None)
+    assert called == ["h1", "h2"]
+
+    bus.emit(E(), None, None)
+    assert called == ["h1", "h2", "h1"]
@@ -1,6 +1,14 @@
+import io
+import json
 from dataclasses import dataclass
+
 from hive.core import World
-from hive.serialize import snapshot, load_into_world
+from hive.serialize import (
+    snapshot,
+    load_into_world,
+    register_serializer,
+    stream_snapshot,
+)
 
 
 @dataclass
@@ -9,6 +17,22 @@ class P:
     y: int
 
 
+@dataclass
+class Inner:
+    v: int
+
+
+@dataclass
+class Outer:
+    inner: Inner
+
+
+@dataclass(kw_only=True)
+class Marker:
+    label: str
+    weight: int
+
+
 def test_snapshot_and_load_roundtrip(tmp_path):
     w = World()
     e = w.create_entity()
@@ -31,3 +55,71 @@ def test_snapshot_and_load_roundtrip(tmp_path):
     assert int(list(comps.keys())[0]) == e
     comp = list(comps.values())[0]
     assert comp.x == 1 and comp.y == 2
+
+
+def test_load_into_world_invalidates_cached_queries():
+    w = World()
+    e = w.create_entity()
+    w.add_component(e, P(1, 2))
+    snap = snapshot(w)
+
+    w2 = World()
+    assert w2.query_cached(P) == []
+    load_into_world(snap, w2)
+    assert [eid for eid, _ in w2.query_cached(P)] == [e]
+
+
+def test_snapshot_nested_dataclass_is_json_serializable():
+    w = World()
+    e = w.create_entity()
+    w.add_component(e, Outer(Inner(5)))
+
+    snap = snapshot(w)
+    # Nested dataclasses must be converted recursively, as asdict does
+    payload = json.loads(json.dumps(snap))
+    assert payload["components"]["Outer"][str(e)]["data"] == {"inner": {"v": 5}}
+
+
+def test_registered_serializer_overrides_dataclass_handling():
+    @dataclass
+    class Custom:
+        v: int
+
+    register_serializer(
+        Custom,
+        lambda c: {"doubled": c.v * 2},
+        lambda d: Custom(d["doubled"] // 2),
+    )
+
+    w = World()
+    e = w.create_entity()
+    w.add_component(e, Custom(3))
+    snap = snapshot(w)
+    assert snap["components"]["Custom"][str(e)]["data"] == {"doubled": 6}
+
+    w2 = World()
+    load_into_world(snap, w2)
+    assert w2.get_components(Custom)[e].v == 3
+
+
+def test_kw_only_dataclass_roundtrip():
+    w = World()
+    e = w.create_entity()
+    w.add_component(e, Marker(label="a", weight=2))
+
+    w2 = World()
+    load_into_world(json.loads(json.dumps(snapshot(w))), w2)
+    restored = w2.get_components(Marker)[e]
+    assert restored.label == "a" and restored.weight == 2
+
+
+def test_stream_snapshot_matches_dict_snapshot():
+    w = World()
+    e1 = w.create_entity()
+    e2 = w.create_entity()
+    w.add_component(e1, P(1, 2))
+    w.add_component(e2, P(3, 4))
+
+    buf = io.StringIO()
+    stream_snapshot(w, buf)
+    assert json.loads(buf.getvalue()) == snapshot(w)
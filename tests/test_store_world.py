@@ -55,6 +55,29 @@ def test_store_safety_limit():
     print("✓ Free ID safety limit works correctly")
 
 
+def test_store_batch_destroy():
+    """Test that destroy_entities matches per-entity destruction."""
+    store = Store()
+
+    @dataclass
+    class Tag:
+        n: int
+
+    entities = [store.create_entity() for _ in range(5)]
+    for e in entities:
+        store.add_component(e, Tag(e))
+
+    store.destroy_entities(entities[1:4])
+
+    remaining = sorted(store.get_components(Tag).keys())
+    assert remaining == [entities[0], entities[4]]
+
+    # Freed IDs join the free list in ascending order; reuse is LIFO
+    assert store.create_entity() in entities[1:4]
+
+    print("✓ Batch destroy works correctly")
+
+
 def test_world_delegation():
     """Test that World properly delegates to Store."""
     world = World()
@@ -71,6 +94,39 @@ def test_world_delegation():
     print("✓ World properly delegates to Store")
 
 
+def test_get_components_view_is_live_and_read_only():
+    """Test that component views track the store but reject mutation."""
+    import pytest
+
+    store = Store()
+
+    @dataclass
+    class Tag:
+        n: int
+
+    # A view fetched before any component of the type exists is still live
+    view = store.get_components_view(Tag)
+    assert dict(view) == {}
+
+    e = store.create_entity()
+    store.add_component(e, Tag(1))
+    assert view[e].n == 1
+
+    # Live: new components appear without refetching
+    e2 = store.create_entity()
+    store.add_component(e2, Tag(2))
+    assert view[e2].n == 2
+
+    # Read-only: entries cannot be added or removed through the view
+    with pytest.raises(TypeError):
+        view[99] = Tag(99)
+
+    # Cached: repeated calls return the same view object
+    assert store.get_components_view(Tag) is view
+
+    print("✓ Component views are live, cached, and read-only")
+
+
 def test_ecs_semantics_empty_query():
     """Test that queries return empty for missing components (ECS semantics)."""
     world = World()